@@ -1,6 +1,7 @@
 from datetime import datetime
 from vernomic import Vernomic, CONSTANTS
 
+import pytest
 from hypothesis import given, strategies as st
 
 # Aliases for better readability
@@ -50,3 +51,88 @@ def test_str_output_format(date, root_name):
     assert parts[3] in CYCLE_DAYS
     assert len(parts[4]) == 4 and parts[4].isdigit()  # HHMM
     print(f"String Output: {output} for date {date}")
+
+
+@given(dates=st.lists(datetimes_within_year(), min_size=0, max_size=20))
+def test_format_many_matches_scalar_path(dates):
+    """Vectorized batch IDs must match the per-instance construction."""
+    pytest.importorskip("numpy")
+    batch = Vernomic.format_many("model", dates)
+    expected = [str(Vernomic(root_name="model", date=d)) for d in dates]
+    assert batch == expected
+
+
+def test_default_date_is_evaluated_per_instance():
+    """The default date must be taken at construction, not at import time."""
+    import time
+
+    first = Vernomic(root_name="model")
+    time.sleep(0.01)
+    second = Vernomic(root_name="model")
+    assert second.date > first.date
+
+
+@given(dates=st.lists(datetimes_within_year(), min_size=1, max_size=20))
+def test_cycle_fields_kernel_matches_scalar_path(dates):
+    """The batch integer kernel must agree with the per-instance math."""
+    np = pytest.importorskip("numpy")
+    from vernomic.vernomic import _cycle_fields_kernel
+
+    n = len(dates)
+    cycles, days, hhmm, yy = (np.empty(n, dtype=np.int64) for _ in range(4))
+    _cycle_fields_kernel(
+        np.array([d.year for d in dates], dtype=np.int64),
+        np.array([d.timetuple().tm_yday for d in dates], dtype=np.int64),
+        np.array([d.hour for d in dates], dtype=np.int64),
+        np.array([d.minute for d in dates], dtype=np.int64),
+        cycles, days, hhmm, yy,
+    )
+    for i, d in enumerate(dates):
+        v = Vernomic(root_name="model", date=d)
+        info = v.cycle_and_day
+        assert cycles[i] == info["cycle_number"]
+        assert days[i] == info["day_of_cycle"]
+        assert f"{hhmm[i]:04d}" == v.version_time
+        assert f"{yy[i]:02d}" == v.version_year
+
+
+@given(date=datetimes_within_year())
+def test_to_json_matches_to_yaml_metadata(date):
+    """JSON and YAML exports must carry the same metadata."""
+    import io
+    import json
+
+    import yaml
+
+    v = Vernomic(root_name="model", file_extension="h5", date=date)
+    json_buf, yaml_buf = io.BytesIO(), io.BytesIO()
+    v.to_json(file=json_buf)
+    v.to_yaml(file=yaml_buf)
+    assert json.loads(json_buf.getvalue()) == yaml.safe_load(yaml_buf.getvalue())
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        "bad\rname",
+        "a\x00b",
+        "nel\x85sep",
+        "line\u2028sep",
+        "c1\x80ctl",
+        "x\x9fy",
+        "del\x7f",
+        "\ufffe",
+        "\uffff",
+        "sur\ud800rogate",
+    ],
+)
+def test_yaml_control_characters_round_trip(description):
+    """Strings with control characters must survive the YAML export."""
+    import io
+
+    import yaml
+
+    v = Vernomic(root_name="model", file_extension="h5", description=description)
+    buf = io.BytesIO()
+    v.to_yaml(file=buf)
+    assert yaml.safe_load(buf.getvalue())["description"] == description
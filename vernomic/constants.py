@@ -2,19 +2,26 @@
 # constants.py – contains static name lists
 # ─────────────────────────────────────────────
 
-CYCLE_DAYS = sorted([
+CYCLE_DAYS = tuple(sorted([
     "Alpaca", "Cat", "Camel", "Cow", "Dog", "Dolphin", "Duck", "Elephant",
     "Eagle", "Fox", "Frog", "Giraffe", "Horse", "Iguana", "Jaguar", "Lion",
     "Lizard", "Monkey", "Mouse", "Owl", "Panda", "Penguin", "Rabbit",
     "Squirrel", "Snake", "Tiger", "Turtle", "Whale"
-])
+]))
 
-CYCLE_NAMES = sorted([
+CYCLE_NAMES = tuple(sorted([
     "Amber", "Bronze", "Coral", "Emerald", "Fuchsia", "Golden",
     "Indigo", "Khaki", "Onyx", "Ruby", "Silver", "Turquoise", "Violet", "Zinc"
-])
+]))
+
+_N_CYCLES = len(CYCLE_NAMES)
+
+# One animal per day of a 4-week cycle, one color per cycle of the year
+# (13 full cycles plus the overflow days).
+assert len(CYCLE_DAYS) == 28
+assert _N_CYCLES == 14
 
 CONSTANTS = {
     "CYCLE_DAYS": CYCLE_DAYS,
     "CYCLE_NAMES": CYCLE_NAMES
-}
\ No newline at end of file
+}
@@ -12,15 +12,169 @@ uses an animal name. The full identifier includes date and time components
 for uniqueness.
 """
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Union, Optional
+import json
 import os
+import re
 import yaml
 from pathlib import Path
 from .constants import CYCLE_DAYS, CYCLE_NAMES
 
-@dataclass
+# orjson serializes this flat schema roughly an order of magnitude faster
+# than stdlib json, but it is optional; to_json works either way.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Prefer the libyaml C dumper when PyYAML was built with it; it emits the
+# same output several times faster than the pure-Python dumper.
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+# Cumulative day counts at the start of each month (non-leap years).
+_MONTH_DOY = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+def _is_leap(year: int) -> bool:
+    """Return True if `year` is a Gregorian leap year."""
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _day_of_year(d: datetime) -> int:
+    """
+    Compute the 1-based day of year for `d` with plain integer arithmetic.
+
+    Equivalent to `d.timetuple().tm_yday` without building a full
+    `time.struct_time` on every call.
+    """
+    return _MONTH_DOY[d.month - 1] + d.day + (1 if d.month > 2 and _is_leap(d.year) else 0)
+
+
+def _cycle_fields_kernel(years, doys, hours, minutes, cycles, days, hhmm, yy):
+    """
+    Integer kernel mapping per-date fields to identifier components.
+
+    Fills `cycles`, `days`, `hhmm` and `yy` in place from int64 arrays of
+    the same length. Written as an explicit indexed loop (no datetime64,
+    no broadcasting) so Numba can compile and vectorize it when installed.
+    """
+    for i in range(years.shape[0]):
+        doy0 = doys[i] - 1
+        cycles[i] = doy0 // 28
+        days[i] = doy0 % 28
+        hhmm[i] = hours[i] * 100 + minutes[i]
+        yy[i] = years[i] % 100
+
+
+try:
+    from numba import njit as _njit
+    _cycle_fields_njit = _njit(cache=True)(_cycle_fields_kernel)
+except ImportError:  # Numba is optional; batches use the datetime64 path.
+    _cycle_fields_njit = None
+
+# Directories already ensured by to_yaml, so batch writers pay the
+# mkdir/stat syscalls only once per target directory.
+_MKDIR_CACHE: set = set()
+
+# Line-per-key template for the fixed metadata schema, built from the
+# dict keys on first use so it can never drift out of sync with to_yaml.
+_YAML_TMPL: Optional[str] = None
+
+
+# Characters a single-quoted YAML scalar cannot carry verbatim: the
+# complement of YAML's printable set (C0/C1 controls except tab, DEL,
+# surrogates, noncharacters) plus the line breaks NEL/LS/PS, which are
+# printable but would break the single-line layout.
+_YAML_UNQUOTABLE = re.compile(
+    "[^\t\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+
+
+def _yaml_scalar(value) -> Optional[str]:
+    """
+    Render one metadata value as a YAML scalar for the template path.
+
+    Strings are single-quoted so they always round-trip as strings
+    (e.g. the ISO datetime). Returns None for values the template cannot
+    render, signalling the caller to fall back to the full dumper.
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, int):
+        return str(value)
+    if _YAML_UNQUOTABLE.search(value):
+        return None
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _dump_yaml(data: dict) -> bytes:
+    """
+    Serialize the metadata dict to YAML bytes.
+
+    The schema is fixed, so instead of letting PyYAML reflect on every
+    value, each value is rendered with `_yaml_scalar` and substituted
+    into a precompiled line-per-key template. Falls back to `yaml.dump`
+    whenever a value (e.g. a multi-line description) needs the full
+    emitter.
+    """
+    global _YAML_TMPL
+    if _YAML_TMPL is None:
+        _YAML_TMPL = "".join(f"{key}: {{{key}}}\n" for key in data)
+    scalars = {}
+    for key, value in data.items():
+        scalar = _yaml_scalar(value)
+        if scalar is None:
+            try:
+                return yaml.dump(data, Dumper=_Dumper, sort_keys=False, encoding="utf-8")
+            except UnicodeEncodeError:
+                # Lone surrogates crash the libyaml emitter; the pure-Python
+                # emitter escapes them in double-quoted style instead.
+                return yaml.dump(data, Dumper=yaml.SafeDumper, sort_keys=False).encode("utf-8")
+        scalars[key] = scalar
+    return _YAML_TMPL.format_map(scalars).encode("utf-8")
+
+
+def _dump_json(data: dict) -> bytes:
+    """Serialize the metadata dict to JSON bytes, via orjson if installed."""
+    if _orjson is not None:
+        return _orjson.dumps(data, option=_orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+class _cached_property:
+    """
+    Minimal `functools.cached_property` replacement for slotted classes.
+
+    `functools.cached_property` stores results in the instance `__dict__`,
+    which a `slots=True` dataclass does not have; this descriptor stores
+    them in the instance's `_cache` slot instead.
+    """
+
+    def __init__(self, func):
+        self._func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cache = instance._cache
+        try:
+            return cache[self._name]
+        except KeyError:
+            value = cache[self._name] = self._func(instance)
+            return value
+
+
+@dataclass(slots=True)
 class Vernomic:
     """
     Generate a mnemonic version identifier using 4-week cycles.
@@ -35,37 +189,89 @@ class Vernomic:
     suffix_name: str = ""
     file_extension: str = ""
     display_version_time: bool = True # Whether to include time in the version ID.
-    date: Union[datetime, int, float] = datetime.now()
+    date: Union[datetime, int, float] = field(default_factory=datetime.now)
     divide_char: str = "_" # Character to separate parts in the identifier.
     description: Optional[str] = None
+    # Backing store for _cached_property values (slotted, so no __dict__).
+    _cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # Name tables bound on the class so hot properties resolve them with a
+    # single attribute lookup instead of a cross-module global load.
+    _CN = CYCLE_NAMES
+    _CD = CYCLE_DAYS
 
     def __post_init__(self):
         """Convert numeric timestamp to datetime if needed."""
-        if isinstance(self.date, (int, float)):
+        # Exact-type check: cheaper than isinstance, and only exact
+        # ints/floats are treated as POSIX timestamps.
+        if type(self.date) in (int, float):
             self.date = datetime.fromtimestamp(self.date)
+        # Normalize the extension once so file_name never re-strips it.
+        if self.file_extension:
+            self.file_extension = self.file_extension.lstrip(".")
 
-    @property
-    def cycle_and_day(self) -> dict[str, int]:
+    @classmethod
+    def from_datetime(cls, root_name: str, date: datetime, **kwargs) -> "Vernomic":
+        """
+        Build a Vernomic from an already-constructed datetime.
+
+        Args:
+            root_name (str): Base name for the version.
+            date (datetime): Timestamp for naming.
+            **kwargs: Any other `Vernomic` field (suffix_name, ...).
+
+        Returns:
+            Vernomic: The new instance.
+        """
+        return cls(root_name=root_name, date=date, **kwargs)
+
+    @classmethod
+    def from_timestamp(cls, root_name: str, timestamp: float, **kwargs) -> "Vernomic":
         """
-        Compute cycle index and day index within that cycle.
+        Build a Vernomic from a POSIX timestamp.
+
+        Args:
+            root_name (str): Base name for the version.
+            timestamp (int | float): Seconds since the epoch.
+            **kwargs: Any other `Vernomic` field (suffix_name, ...).
+
+        Returns:
+            Vernomic: The new instance.
+        """
+        return cls(root_name=root_name, date=datetime.fromtimestamp(timestamp), **kwargs)
+
+    @_cached_property
+    def _cycle_day_tuple(self) -> tuple[int, int]:
+        """
+        Compute `(cycle_number, day_of_cycle)` for this instance's date.
 
         The year is divided into 13 cycles of 28 days (plus overflow).
         - cycle_number: 0-based index of the 28-day cycle.
         - day_of_cycle: 0-based index of the day within the 28-day cycle.
 
+        The result is computed once and cached, since `date` never changes
+        after construction. Internal callers use this tuple directly;
+        `cycle_and_day` wraps it in a dict for the public API.
+        """
+        # Day of year: 1 through 365 (or 366)
+        day_of_year = _day_of_year(self.date)
+        return (day_of_year - 1) // 28, (day_of_year - 1) % 28
+
+    @property
+    def cycle_and_day(self) -> dict[str, int]:
+        """
+        Cycle index and day index within that cycle.
+
         Returns:
             dict: {
                 "cycle_number": int,
                 "day_of_cycle": int
             }
         """
-        # Day of year: 1 through 365 (or 366)
-        day_of_year = self.date.timetuple().tm_yday
-        cycle_number = (day_of_year - 1) // 28
-        day_of_cycle = (day_of_year - 1) % 28
+        cycle_number, day_of_cycle = self._cycle_day_tuple
         return {"cycle_number": cycle_number, "day_of_cycle": day_of_cycle}
 
-    @property
+    @_cached_property
     def day_name(self) -> str:
         """
         Combine cycle name and animal day name.
@@ -76,12 +282,10 @@ class Vernomic:
             str: "<CycleName>_<AnimalName>"
         """
         c = self.divide_char
-        info = self.cycle_and_day
-        cycle_label = CYCLE_NAMES[info["cycle_number"]]
-        day_label = CYCLE_DAYS[info["day_of_cycle"]]
-        return f"{cycle_label}{c}{day_label}"
+        cycle_number, day_of_cycle = self._cycle_day_tuple
+        return f"{self._CN[cycle_number]}{c}{self._CD[day_of_cycle]}"
 
-    @property
+    @_cached_property
     def version_time(self) -> str | None:
         """
         Format the time component for the identifier.
@@ -93,7 +297,7 @@ class Vernomic:
             return None
         return f"{self.date.hour:02d}{self.date.minute:02d}"
     
-    @property
+    @_cached_property
     def version_year(self) -> str:
         """
         Format the year component for the identifier.
@@ -101,14 +305,15 @@ class Vernomic:
         Returns:
             str: Last two digits of the year (YY).
         """
-        return str(self.date.year)[-2:]
+        return f"{self.date.year % 100:02d}"
 
-    @property
+    @_cached_property
     def vernomic_id(self) -> str:
         """
         Build the core Vernomic identifier string.
 
         Combines root_name, year, day_name, time, and optional suffix.
+        Built as a single f-string (no intermediate list/join) and cached.
 
         Format:
             <root_name>_<YY>_<CycleName>_<AnimalName>_<HHMM>[_<suffix_name>]
@@ -117,14 +322,100 @@ class Vernomic:
             str: The full mnemonic version ID.
         """
         c = self.divide_char
-        parts = [self.root_name, self.version_year, self.day_name]
+        vid = f"{self.root_name}{c}{self.version_year}{c}{self.day_name}"
         if self.version_time:
-            parts.append(self.version_time)
+            vid = f"{vid}{c}{self.version_time}"
         if self.suffix_name:
-            parts.append(self.suffix_name)
-        return f"{c}".join(parts)
+            vid = f"{vid}{c}{self.suffix_name}"
+        return vid
+
+    @classmethod
+    def format_many(
+        cls,
+        root_name: str,
+        dates,
+        suffix_name: str = "",
+        display_version_time: bool = True,
+        divide_char: str = "_",
+    ) -> list[str]:
+        """
+        Build Vernomic identifiers for many dates at once (vectorized).
 
-    @property
+        Computes year, day-of-year, cycle and time components across the
+        whole batch with NumPy datetime64 arithmetic instead of creating
+        one `Vernomic` instance per date, which is much faster for large
+        batches. Requires NumPy (install the `numpy` extra). When Numba
+        is also installed, the integer arithmetic runs through a compiled
+        kernel instead.
+
+        Args:
+            root_name (str): Base name shared by all identifiers.
+            dates: Sequence of `datetime` objects or a NumPy datetime64 array.
+            suffix_name (str): Optional tag appended to every identifier.
+            display_version_time (bool): Whether to include the HHMM part.
+            divide_char (str): Character separating identifier parts.
+
+        Returns:
+            list[str]: One Vernomic identifier per input date, in order.
+        """
+        import numpy as np  # Optional dependency, only needed for batches.
+
+        c = divide_char
+        minutes = np.asarray(dates, dtype="datetime64[m]")
+        if minutes.shape[0] == 0:
+            # np.char.zfill chokes on empty arrays; an empty batch is valid.
+            return []
+        days = minutes.astype("datetime64[D]")
+        years = days.astype("datetime64[Y]")
+
+        day_of_year = (days - years).astype(int) + 1
+
+        if _cycle_fields_njit is not None:
+            # Compiled path: feed plain int64 arrays to the Numba kernel
+            # and assemble the strings in Python.
+            n = minutes.shape[0]
+            minute_of_day = (minutes - days).astype(np.int64)
+            cycle_number = np.empty(n, dtype=np.int64)
+            day_of_cycle = np.empty(n, dtype=np.int64)
+            hhmm = np.empty(n, dtype=np.int64)
+            yy = np.empty(n, dtype=np.int64)
+            _cycle_fields_njit(
+                years.astype(np.int64) + 1970,
+                day_of_year.astype(np.int64),
+                minute_of_day // 60,
+                minute_of_day % 60,
+                cycle_number, day_of_cycle, hhmm, yy,
+            )
+            time_parts = (
+                [f"{c}{t:04d}" for t in hhmm] if display_version_time else [""] * n
+            )
+            tail = f"{c}{suffix_name}" if suffix_name else ""
+            return [
+                f"{root_name}{c}{yy[i]:02d}{c}"
+                f"{CYCLE_NAMES[cycle_number[i]]}{c}{CYCLE_DAYS[day_of_cycle[i]]}"
+                f"{time_parts[i]}{tail}"
+                for i in range(n)
+            ]
+
+        yy = (years.astype(int) + 1970) % 100
+        cycle_number = (day_of_year - 1) // 28
+        day_of_cycle = (day_of_year - 1) % 28
+
+        def _two_digits(values):
+            return np.char.zfill(values.astype("U2"), 2)
+
+        out = np.char.add(f"{root_name}{c}", _two_digits(yy))
+        out = np.char.add(np.char.add(out, c), np.asarray(CYCLE_NAMES)[cycle_number])
+        out = np.char.add(np.char.add(out, c), np.asarray(CYCLE_DAYS)[day_of_cycle])
+        if display_version_time:
+            minute_of_day = (minutes - days).astype(int)
+            hhmm = np.char.add(_two_digits(minute_of_day // 60), _two_digits(minute_of_day % 60))
+            out = np.char.add(np.char.add(out, c), hhmm)
+        if suffix_name:
+            out = np.char.add(out, f"{c}{suffix_name}")
+        return out.tolist()
+
+    @_cached_property
     def file_name(self) -> str:
         """
         Construct the filename with extension.
@@ -137,27 +428,17 @@ class Vernomic:
         """
         if not self.file_extension:
             raise ValueError("`file_extension` must be set before calling file_name.")
-        ext = self.file_extension.lstrip(".")
-        return f"{self.vernomic_id}.{ext}"
+        return f"{self.vernomic_id}.{self.file_extension}"
 
-    def to_yaml(self, path: str = "./") -> None:
+    def _metadata(self) -> dict:
         """
-        Export metadata to a YAML file.
-
-        If `path` is a directory (path ends with os.sep or exists as a dir),
-        the file will be saved as:
-            <path>/<vernomic_id>.yaml
-        Otherwise, if no extension is provided, ".yaml" is appended.
+        Assemble the metadata dictionary (all derived strings are cached).
 
-        Args:
-            path (str | Path): Directory or file path for output.
-
-        Raises:
-            FileExistsError: If a parent path exists and is not a directory.
+        Returns:
+            dict: The fixed-schema metadata exported by to_yaml/to_json.
         """
-        # Assemble metadata dictionary
-        info = self.cycle_and_day
-        data = {
+        cycle_number, day_of_cycle = self._cycle_day_tuple
+        return {
             "vernomic_id": self.vernomic_id,
             "file_name": self.file_name,
             "root_name": self.root_name,
@@ -170,39 +451,128 @@ class Vernomic:
             "hour": self.date.hour,
             "minute": self.date.minute,
             "second": self.date.second,
-            "cycle_number": info["cycle_number"],
-            "day_of_cycle": info["day_of_cycle"],
-            "cycle_name": CYCLE_NAMES[info["cycle_number"]],
-            "day_name": CYCLE_DAYS[info["day_of_cycle"]],
+            "cycle_number": cycle_number,
+            "day_of_cycle": day_of_cycle,
+            "cycle_name": self._CN[cycle_number],
+            "day_name": self._CD[day_of_cycle],
             "version_year": self.version_year,
             "version_day": self.day_name,
             "version_time": self.version_time,
             "description": self.description
         }
 
-        # Normalize to Path
-        p = Path(path)
+    def _write_output(self, buf: bytes, path, extension: str, fsync: bool, file) -> None:
+        """
+        Write serialized metadata bytes to `file` or to the resolved `path`.
+
+        Shared by `to_yaml` and `to_json`; see `to_yaml` for the path
+        semantics (`extension` is the default suffix, e.g. ".yaml").
+        """
+        # Write to a caller-provided file object, flushing explicitly so
+        # no stale data sits in its buffer.
+        if file is not None:
+            file.write(buf)
+            flush = getattr(file, "flush", None)
+            if flush is not None:
+                flush()
+            if fsync and hasattr(file, "fileno"):
+                os.fsync(file.fileno())
+            return
+
+        # Work on a plain string; a Path is built only for the final write
+        path = os.fspath(path)
         # Detect directory intent
-        is_dir = str(path).endswith(os.sep) or p.is_dir()
-        if is_dir:
+        if path.endswith(("/", os.sep)) or os.path.isdir(path):
             # Use vernomic_id as filename
-            p = p / f"{self.vernomic_id}.yaml"
+            path = os.path.join(path, f"{self.vernomic_id}{extension}")
+        # Ensure the default extension
+        elif not os.path.splitext(path)[1]:
+            path = f"{path}{extension}"
+
+        # Validate parent directory (skip the syscalls if already ensured)
+        parent = os.path.dirname(path) or "."
+        if parent not in _MKDIR_CACHE:
+            if os.path.exists(parent) and not os.path.isdir(parent):
+                raise FileExistsError(
+                    f"Cannot create directory {parent!r}: not a directory."
+                )
+            # Create directory if needed
+            os.makedirs(parent, exist_ok=True)
+            _MKDIR_CACHE.add(parent)
+
+        # Write the file (serialized straight to bytes, no intermediate str)
+        p = Path(path)
+        p.write_bytes(buf)
+        if fsync:
+            fd = os.open(p, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def to_yaml(self, path: str = "./", *, fsync: bool = False, file=None) -> None:
+        """
+        Export metadata to a YAML file.
+
+        If `path` is a directory (path ends with os.sep or exists as a dir),
+        the file will be saved as:
+            <path>/<vernomic_id>.yaml
+        Otherwise, if no extension is provided, ".yaml" is appended.
 
-        # Ensure .yaml extension
-        if not p.suffix:
-            p = p.with_suffix(".yaml")
+        Args:
+            path (str | Path): Directory or file path for output.
+            fsync (bool): Force the written data to disk with os.fsync,
+                for durability on network/remote filesystems.
+            file: Optional binary file-like object to write to instead of
+                `path`; the buffer is flushed explicitly after writing.
 
-        # Validate parent directory
-        parent = p.parent
-        if parent.exists() and not parent.is_dir():
-            raise FileExistsError(
-                f"Cannot create directory {parent!r}: not a directory."
-            )
-        # Create directory if needed
-        parent.mkdir(parents=True, exist_ok=True)
+        Raises:
+            FileExistsError: If a parent path exists and is not a directory.
+        """
+        self._write_output(_dump_yaml(self._metadata()), path, ".yaml", fsync, file)
 
-        # Write YAML file
-        p.write_text(yaml.dump(data, sort_keys=False))
+    def to_json(self, path: str = "./", *, fsync: bool = False, file=None) -> None:
+        """
+        Export metadata to a JSON file.
+
+        JSON is considerably cheaper to serialize than YAML for this flat
+        str/int schema; uses orjson when installed, stdlib json otherwise.
+        Same path semantics as `to_yaml`, with a ".json" default suffix.
+
+        Args:
+            path (str | Path): Directory or file path for output.
+            fsync (bool): Force the written data to disk with os.fsync,
+                for durability on network/remote filesystems.
+            file: Optional binary file-like object to write to instead of
+                `path`; the buffer is flushed explicitly after writing.
+
+        Raises:
+            FileExistsError: If a parent path exists and is not a directory.
+        """
+        self._write_output(_dump_json(self._metadata()), path, ".json", fsync, file)
+
+    @classmethod
+    def dump_many(cls, vernomics, path: str = "./", max_workers: int = 8) -> None:
+        """
+        Export the metadata of many Vernomic instances concurrently.
+
+        YAML emission (with libyaml) and the file writes release the GIL,
+        so a small thread pool overlaps disk latency when writing a batch
+        of files. The target directory is created once up front so the
+        workers skip the mkdir path entirely.
+
+        Args:
+            vernomics: Iterable of `Vernomic` instances to export.
+            path (str | Path): Directory or file path passed to each
+                `to_yaml` call.
+            max_workers (int): Number of writer threads.
+        """
+        path = os.fspath(path)
+        if path.endswith(("/", os.sep)) or os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # list() drains the iterator so any worker exception is raised.
+            list(executor.map(lambda v: v.to_yaml(path), vernomics))
 
     def __str__(self) -> str:
         """